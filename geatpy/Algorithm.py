@@ -424,6 +424,7 @@ class MoeaAlgorithm(Algorithm):  # 多目标优化算法模板父类
                 self.display()
         self.passTime += time.time() - self.timeSlot  # 更新用时记录，因为已经要结束，因此不用再更新时间戳
         self.draw(NDSet, EndFlag=True)  # 显示最终结果图
+        ea.Population.clearPool()  # 进化已结束，释放数组缓冲池中的缓存
         # 返回帕累托最优个体以及最后一代种群
         return [NDSet, pop]
 
@@ -662,5 +663,6 @@ class SoeaAlgorithm(Algorithm):  # 单目标优化算法模板父类
                     self.display()
         self.passTime += time.time() - self.timeSlot  # 更新用时记录，因为已经要结束，因此不用再更新时间戳
         self.draw(pop, EndFlag=True)  # 显示最终结果图
+        ea.Population.clearPool()  # 进化已结束，释放数组缓冲池中的缓存
         # 返回最优个体以及最后一代种群
         return [self.BestIndi, pop]
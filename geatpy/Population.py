@@ -1,9 +1,183 @@
 # -*- coding: utf-8 -*-
 import os
+from collections import OrderedDict
 import numpy as np
 import geatpy as ea
 
 
+def _readonly_view(arr):
+    view = arr.view()
+    view.flags.writeable = False
+    return view
+
+
+def _copy_into(dst, src):
+    # 把src复制到dst中并返回结果：形状和类型相同、可写且与src不共用内存的dst会直接用np.copyto覆盖，否则返回src的副本
+    if src is None:
+        return None
+    if dst is not None and dst is not src and dst.shape == src.shape and dst.dtype == src.dtype and \
+            dst.flags.writeable and not np.may_share_memory(dst, src):
+        np.copyto(dst, src)
+        return dst
+    return src.copy(order='K')
+
+
+def _split_slices(NIND, n_islands, sizes, className):
+    # 把0~NIND-1的个体按先后顺序划分为n_islands段，返回各段对应的slice；sizes为None时尽量均分，前面的段比后面的段至多多1个个体
+    if sizes is None:
+        if not isinstance(n_islands, int) or n_islands <= 0:
+            raise RuntimeError('error in ' + className + ': n_islands must be a positive integer. (子种群的数目必须为正整数。)')
+        sizes = [NIND // n_islands + (1 if i < NIND % n_islands else 0) for i in range(n_islands)]
+    elif len(sizes) != n_islands or sum(sizes) != NIND:
+        raise RuntimeError(
+            'error in ' + className + ': sizes disagree. (sizes的长度必须等于n_islands，且其元素之和必须等于种群规模。)')
+    slices = []
+    start = 0
+    for size in sizes:
+        slices.append(slice(start, start + int(size)))
+        start += int(size)
+    return slices
+
+
+def _as_slice(index, NIND):
+    # 若index是0 <= a < b <= NIND范围内连续递增的整数下标向量（如np.arange(a, b)），则返回等价的slice(a, b)，否则返回None
+    if len(index) == 0 or index.dtype.kind not in 'iu' or index[0] < 0 or index[-1] >= NIND or \
+            index[-1] - index[0] != len(index) - 1:
+        return None
+    if len(index) > 2 and np.any(np.diff(index) != 1):
+        return None
+    return slice(int(index[0]), int(index[-1]) + 1)
+
+
+class _BufferPool:
+    """
+_BufferPool : class - Numpy数组缓冲池（内部使用）
+
+描述:
+    以(shape, dtype)为键缓存已不再使用的Numpy数组，使每一代进化中形状相同的染色体矩阵、
+    目标函数值矩阵等可以重复利用同一块内存，减少反复申请和释放内存的开销。
+    数组只能通过Population.release()归还到缓冲池中。
+    缓冲池中的数组总数不超过maxTotal，超出时会丢弃最久未被归还过的那种(shape, dtype)的数组，
+    使同一进程中先后进行多次规模不同的进化时，旧规模的数组不会一直占用内存。
+
+"""
+
+    def __init__(self, maxNum=4, maxTotal=32):
+        self.maxNum = maxNum  # 每种(shape, dtype)最多缓存的数组个数
+        self.maxTotal = maxTotal  # 缓冲池中最多缓存的数组总数
+        self.buffers = OrderedDict()  # 按最近一次归还的先后顺序排列，最久未归还的在最前面
+        self.total = 0
+
+    def clear(self):
+
+        """
+        描述: 清空缓冲池，释放其中缓存的所有数组。
+        
+        """
+
+        self.buffers.clear()
+        self.total = 0
+
+    def get(self, shape, dtype, order='C'):
+
+        """
+        描述: 获取一个形状为shape、类型为dtype、存储顺序为order的数组，缓冲池中没有时才新建，注意数组的元素值是未初始化的。
+        
+        """
+
+        key = (tuple(shape), np.dtype(dtype), order)
+        stack = self.buffers.get(key)
+        if stack:
+            self.total -= 1
+            arr = stack.pop()
+            if not stack:
+                del self.buffers[key]
+            return arr
+        return np.empty(shape, dtype, order=order)
+
+    def put(self, arr):
+
+        """
+        描述: 把数组归还到缓冲池中。视图、只读数组或内存不连续的数组不会被缓存。
+        
+        """
+
+        if arr is None or not arr.flags.owndata or not arr.flags.writeable:
+            return
+        if arr.flags.c_contiguous:
+            order = 'C'
+        elif arr.flags.f_contiguous:
+            order = 'F'
+        else:
+            return
+        key = (arr.shape, arr.dtype, order)
+        stack = self.buffers.get(key, [])
+        if len(stack) >= self.maxNum:
+            return
+        stack.append(arr)
+        self.buffers[key] = stack
+        self.buffers.move_to_end(key)
+        self.total += 1
+        while self.total > self.maxTotal:  # 丢弃最久未归还的那种数组中最早归还的一个
+            oldKey, oldStack = next(iter(self.buffers.items()))
+            oldStack.pop(0)
+            self.total -= 1
+            if not oldStack:
+                del self.buffers[oldKey]
+
+    def _order(self, arr):
+
+        """
+        描述: 得到与arr一致的存储顺序，只有按列存储的矩阵才返回'F'，以便结果保持原有的存储布局。
+        
+        """
+
+        return 'F' if arr.flags.f_contiguous and not arr.flags.c_contiguous else 'C'
+
+    def take(self, arr, index):
+
+        """
+        描述: 按整数下标向量index取出arr中对应的行，结果写入从缓冲池中获取的数组中。
+        
+        """
+
+        if len(index) > 0 and (index.min() < -arr.shape[0] or index.max() >= arr.shape[0]):
+            raise IndexError('error in Population: index out of range. (下标越界。)')
+        out = self.get((len(index),) + arr.shape[1:], arr.dtype, self._order(arr))
+        return np.take(arr, index, axis=0, out=out, mode='wrap')  # 下标已检查过，用wrap模式避免np.take对out进行额外的缓冲
+
+    def concat(self, a, b):
+
+        """
+        描述: 按行合并两个矩阵，结果直接写入从缓冲池中获取的数组中。
+             两个矩阵分别被整块复制到结果中已知的连续区域里，其中一个矩阵没有行时相应的复制也就不会发生。
+        
+        """
+
+        if a.shape[1:] != b.shape[1:]:
+            raise ValueError('error in Population: the matrices to be merged must have the same number of columns. (待合并的矩阵列数必须一致。)')
+        n1 = a.shape[0]
+        out = self.get((n1 + b.shape[0],) + a.shape[1:], np.result_type(a, b), self._order(a))
+        out[:n1] = a
+        out[n1:] = b
+        return out
+
+    def stack(self, parts):
+
+        """
+        描述: 按行合并列表parts中的多个矩阵，只申请一次结果数组，每个矩阵被整块复制到结果中对应的连续区域里。
+        
+        """
+
+        out = self.get((sum(part.shape[0] for part in parts),) + parts[0].shape[1:], np.result_type(*parts),
+                       self._order(parts[0]))
+        start = 0
+        for part in parts:
+            out[start:start + part.shape[0]] = part
+            start += part.shape[0]
+        return out
+
+
 class Population:
     """
 Population : class - 种群类
@@ -30,6 +204,8 @@ Population : class - 种群类
                        尤其可以在多种群进化优化过程中对个体进行统一的适应度评价时使用。
     
     Field    : array - 译码矩阵，可以是FieldD或FieldDR（详见Geatpy数据结构）。
+                       译码矩阵在整个进化过程中是不变的，因此种群只引用而不复制它，并会把它设置为只读，
+                       所有由该种群得到的种群都共用同一个译码矩阵。
     
     Chrom    : array - 种群染色体矩阵，每一行对应一个个体的一条染色体。
     
@@ -44,12 +220,21 @@ Population : class - 种群类
     
     Phen     : array - 种群表现型矩阵（即种群各染色体解码后所代表的决策变量所组成的矩阵）。
     
+    layout   : str   - 染色体矩阵的存储布局，
+                       'AoS':按行存储（默认），同一个个体的各个基因在内存中连续存放，适合按个体进行选择、交叉等操作；
+                       'SoA':按列存储，同一个决策变量在所有个体上的取值在内存中连续存放，
+                             适合逐个决策变量进行变异、边界处理等按列进行的操作，但按个体选取时会更慢。
+                       注意：种群的切片、合并、打乱等操作会保持该布局，但算子返回的新染色体矩阵通常是按行存储的。
+    
 函数:
     详见源码。
 
 """
 
-    def __init__(self, Encoding, Field, NIND, Chrom=None, ObjV=None, FitnV=None, CV=None, Phen=None):
+    _pool = _BufferPool()  # 所有种群共用的数组缓冲池
+
+    def __init__(self, Encoding, Field, NIND, Chrom=None, ObjV=None, FitnV=None, CV=None, Phen=None, layout='AoS',
+                 seed=None, _copy=True):
 
         """
         描述: 种群类的构造函数，用于实例化种群对象，例如：
@@ -61,6 +246,14 @@ Population : class - 种群类
              一开始可以只传入Encoding, Field以及NIND来完成种群对象的实例化，
              其他属性可以后面再通过计算进行赋值。
              另外还可以利用ea.Population(Encoding, Field, 0)来创建一个“空种群”,即不含任何个体的种群对象。
+             layout用于设置染色体矩阵的存储布局（详见种群类的layout属性）。
+             seed用于为种群设置独立的随机数生成器（np.random.Generator），可以是整数种子或Generator对象，
+             此时shuffle()等操作使用该生成器，从而使结果可复现，且各种群（如岛屿模型中的各个岛屿）之间的随机数流相互独立；
+             seed缺省时使用Numpy的全局随机数生成器，即仍可通过np.random.seed()控制随机性。
+             由该种群切片、合并、复制得到的种群共用同一个随机数生成器。
+             注意：传入的Field不会被复制，而是会被直接引用并设置为只读，如果之后还需要修改该译码矩阵，应先复制再传入。
+             _copy为内部使用的参数，当传入的矩阵是新生成的且不会被外部再修改时（如切片、合并的结果），
+             可设置_copy=False以直接引用这些矩阵，避免多余的复制。
              
         """
 
@@ -68,19 +261,34 @@ Population : class - 种群类
             self.sizes = NIND
         else:
             raise RuntimeError('error in Population: Size error. (种群规模设置有误，必须为非负整数。)')
+        if layout not in ('AoS', 'SoA'):
+            raise RuntimeError('error in Population: layout must be ''AoS'' or ''SoA''. (layout必须为''AoS''或''SoA''。)')
         self.ChromNum = 1
         self.Encoding = Encoding
+        self.layout = layout
+        self._rng = np.random.default_rng(seed) if seed is not None else None
         if Encoding is None:
             self.Field = None
             self.Chrom = None
         else:
-            self.Field = Field.copy()
-            self.Chrom = Chrom.copy() if Chrom is not None else None
+            if isinstance(Field, np.ndarray) and Field.flags.writeable:
+                Field.flags.writeable = False  # 译码矩阵在进化过程中不会改变，因此直接引用而不复制
+            self.Field = Field
+            if Chrom is None:
+                self.Chrom = None
+            elif layout == 'SoA':
+                self.Chrom = Chrom.copy(order='F') if _copy else np.asfortranarray(Chrom)
+            else:
+                self.Chrom = Chrom.copy() if _copy else Chrom
         self.Lind = Chrom.shape[1] if Chrom is not None else 0
-        self.ObjV = ObjV.copy() if ObjV is not None else None
-        self.FitnV = FitnV.copy() if FitnV is not None else None
-        self.CV = CV.copy() if CV is not None else None
-        self.Phen = Phen.copy() if Phen is not None else None
+        self.ObjV = ObjV.copy() if _copy and ObjV is not None else ObjV
+        self.FitnV = FitnV.copy() if _copy and FitnV is not None else FitnV
+        self.CV = CV.copy() if _copy and CV is not None else CV
+        if _copy and Phen is not None:
+            # 若Phen是Chrom的只读视图（见decoding），则复制后仍让Phen引用新的Chrom
+            self.Phen = _readonly_view(self.Chrom) if self.Chrom is not None and Population._is_alias(Phen, Chrom) else Phen.copy()
+        else:
+            self.Phen = Phen
 
     def initChrom(self, NIND=None):
 
@@ -99,36 +307,82 @@ Population : class - 种群类
         if NIND is not None:
             self.sizes = NIND  # 重新设置种群规模
         self.Chrom = ea.crtpc(self.Encoding, self.sizes, self.Field)  # 生成染色体矩阵
+        if self.layout == 'SoA':
+            self.Chrom = np.asfortranarray(self.Chrom)
         self.Lind = self.Chrom.shape[1]  # 计算染色体的长度
         self.ObjV = None
         self.FitnV = None
         self.CV = None
+        self.Phen = None  # 原有的表现型已失效，不在此处解码，而是在需要时（如计算目标函数值前）再调用decoding()进行解码
 
     def decoding(self):
 
         """
         描述: 种群染色体解码。
+             当Encoding为'BG'时，Chrom的元素只能为0或1，且应保持crtpc及各遗传算子所生成的整数类型，
+             不要把它转换为uint8、bool或用np.packbits压缩后的形式，因为底层的bs2ri及各遗传算子都是按该类型处理染色体的。
+             当Encoding为'RI'或'P'时，表现型与染色体相同，此时返回的是Chrom的只读视图而不是副本，
+             它与Chrom共用内存，因此修改Chrom后表现型也会随之改变；如需修改表现型，应先对其进行复制。
         
         """
 
         if self.Encoding == 'BG':  # 此时Field实际上为FieldD
             Phen = ea.bs2ri(self.Chrom, self.Field)  # 把二进制/格雷码转化为实整数
         elif self.Encoding == 'RI' or self.Encoding == 'P':
-            Phen = self.Chrom.copy()
+            Phen = _readonly_view(self.Chrom)
         else:
             raise RuntimeError(
                 'error in Population.decoding: Encoding must be ''BG'' or ''RI'' or ''P''. (编码设置有误，解码时Encoding必须为''BG'', ''RI'' 或 ''P''。)')
         return Phen
 
-    def copy(self):
+    @staticmethod
+    def _is_alias(Phen, Chrom):
+
+        """
+        描述: 判断Phen是否为decoding()所得到的Chrom的只读视图。
+        
+        """
+
+        return not Phen.flags.writeable and Phen.shape == Chrom.shape and np.may_share_memory(Phen, Chrom)
+
+    def _phen_aliased(self):
+
+        """
+        描述: 判断种群的表现型矩阵是否与染色体矩阵共用内存。
+        
+        """
+
+        return self.Phen is not None and self.Chrom is not None and self._is_alias(self.Phen, self.Chrom)
+
+    def copy(self, deep=True, reuse=None):
 
         """
         copy : function - 种群的复制
         用法:
             假设pop是一个种群矩阵，那么：pop1 = pop.copy()即可完成对pop种群的复制。
+            deep=False时为浅复制，pop1与pop共用同一批矩阵，只适合在马上会给pop1的属性重新赋值
+            （如pop1.Chrom = newChrom）的场合使用，此时修改pop1的矩阵元素会同时修改pop对应的矩阵元素。
+            reuse为一个种群对象时，将pop的信息原地复制到reuse中并返回reuse，
+            与pop形状和类型相同的矩阵会直接用np.copyto覆盖，不再重新申请内存，
+            因此可以在每一代中重复利用同一个临时种群；注意reuse原来的矩阵不能被其他地方引用。
             
         """
 
+        if reuse is not None:
+            reuse.sizes = self.sizes
+            reuse.ChromNum = self.ChromNum
+            reuse.Encoding = self.Encoding
+            reuse.Field = self.Field
+            reuse.Lind = self.Lind
+            reuse.layout = self.layout
+            reuse._rng = self._rng
+            phenAliased = self._phen_aliased()
+            for name in ('Chrom', 'ObjV', 'FitnV', 'CV', 'Phen'):
+                if name == 'Phen' and phenAliased:
+                    reuse.Phen = _readonly_view(reuse.Chrom)
+                    continue
+                setattr(reuse, name, _copy_into(getattr(reuse, name, None), getattr(self, name)))
+            return reuse
         return Population(self.Encoding,
                           self.Field,
                           self.sizes,
@@ -136,7 +390,10 @@ Population : class - 种群类
                           self.ObjV,
                           self.FitnV,
                           self.CV,
-                          self.Phen)
+                          self.Phen,
+                          self.layout,
+                          seed=self._rng,
+                          _copy=deep)
 
     def __getitem__(self, index):
 
@@ -152,35 +409,60 @@ Population : class - 种群类
         """
 
         # 计算切片后的长度以及对index进行格式处理
-        if not isinstance(index, (slice, np.ndarray, list, int, np.int32, np.int64)):
+        if __debug__ and not isinstance(index, (slice, np.ndarray, list, int, np.int32, np.int64)):
             raise RuntimeError(
                 'error in Population: index must be an integer, a 1-D list, or a 1-D array. (index必须是一个整数，一维的列表或者一维的向量。)')
-        if isinstance(index, slice):
-            NIND = (index.stop - (index.start if index.start is not None else 0)) // (
-                index.step if index.step is not None else 1)
-            index_array = index
-        else:
+        if not isinstance(index, slice):
             index_array = np.array(index).reshape(-1)
             if index_array.dtype == bool:
-                NIND = int(np.sum(index_array))
+                if len(index_array) != self.sizes:
+                    raise RuntimeError(
+                        'error in Population: the length of the boolean index must be equal to the population size. (布尔型下标向量的长度必须等于种群规模。)')
+                index_array = np.flatnonzero(index_array)
+            elif len(index_array) == 0:
+                index_array = np.zeros(0, dtype=int)
+            index = _as_slice(index_array, self.sizes)  # 连续的下标向量转化为slice，以整块复制代替逐行选取
+        if isinstance(index, slice):
+            NIND = len(range(*index.indices(self.sizes)))
+            if self.Encoding is None:
+                NewChrom = None
             else:
-                NIND = len(index_array)
-            if len(index_array) == 0:
-                index_array = []
+                if self.Chrom is None:
+                    raise RuntimeError('error in Population: Chrom is None. (种群染色体矩阵未初始化。)')
+                NewChrom = self.Chrom[index]
+            return Population(self.Encoding,
+                              self.Field,
+                              NIND,
+                              NewChrom,
+                              self.ObjV[index] if self.ObjV is not None else None,
+                              self.FitnV[index] if self.FitnV is not None else None,
+                              self.CV[index] if self.CV is not None else None,
+                              self.Phen[index] if self.Phen is not None else None,
+                              self.layout,
+                              seed=self._rng)  # slice切片得到的是视图，需要复制
+        NIND = len(index_array)
+        pool = self._pool
         if self.Encoding is None:
             NewChrom = None
         else:
             if self.Chrom is None:
                 raise RuntimeError('error in Population: Chrom is None. (种群染色体矩阵未初始化。)')
-            NewChrom = self.Chrom[index_array]
+            NewChrom = pool.take(self.Chrom, index_array)
+        if self._phen_aliased():
+            NewPhen = _readonly_view(NewChrom)
+        else:
+            NewPhen = pool.take(self.Phen, index_array) if self.Phen is not None else None
         return Population(self.Encoding,
                           self.Field,
                           NIND,
                           NewChrom,
-                          self.ObjV[index_array] if self.ObjV is not None else None,
-                          self.FitnV[index_array] if self.FitnV is not None else None,
-                          self.CV[index_array] if self.CV is not None else None,
-                          self.Phen[index_array] if self.Phen is not None else None)
+                          pool.take(self.ObjV, index_array) if self.ObjV is not None else None,
+                          pool.take(self.FitnV, index_array) if self.FitnV is not None else None,
+                          pool.take(self.CV, index_array) if self.CV is not None else None,
+                          NewPhen,
+                          self.layout,
+                          seed=self._rng,
+                          _copy=False)
 
     def shuffle(self):
 
@@ -190,18 +472,55 @@ Population : class - 种群类
         
         """
 
-        shuff = np.arange(self.sizes)
-        np.random.shuffle(shuff)  # 打乱顺序
+        shuff = (self._rng if self._rng is not None else np.random).permutation(self.sizes)  # 生成随机排列的下标
+        pool = self._pool
+        phenAliased = self._phen_aliased()
         if self.Encoding is None:
             self.Chrom = None
         else:
             if self.Chrom is None:
                 raise RuntimeError('error in Population: Chrom is None. (种群染色体矩阵未初始化。)')
-            self.Chrom = self.Chrom[shuff, :]
-        self.ObjV = self.ObjV[shuff, :] if self.ObjV is not None else None
-        self.FitnV = self.FitnV[shuff] if self.FitnV is not None else None
-        self.CV = self.CV[shuff, :] if self.CV is not None else None
-        self.Phen = self.Phen[shuff, :] if self.Phen is not None else None
+            self.Chrom = pool.take(self.Chrom, shuff)
+        self.ObjV = pool.take(self.ObjV, shuff) if self.ObjV is not None else None
+        self.FitnV = pool.take(self.FitnV, shuff) if self.FitnV is not None else None
+        self.CV = pool.take(self.CV, shuff) if self.CV is not None else None
+        if phenAliased:
+            self.Phen = _readonly_view(self.Chrom)
+        else:
+            self.Phen = pool.take(self.Phen, shuff) if self.Phen is not None else None
+
+    def _validate_compat(self, pop):
+
+        """
+        描述: 检查pop与当前种群的染色体编码方式和译码矩阵是否一致，不一致时抛出异常。
+             由于译码矩阵通常是同一个对象，这里先比较引用，只有引用不同时才逐元素比较。
+        
+        """
+
+        if self.Encoding != pop.Encoding:
+            raise RuntimeError('error in Population: Encoding disagree. (两种群染色体的编码方式必须一致。)')
+        if self.Field is not pop.Field and not np.array_equal(self.Field, pop.Field):
+            raise RuntimeError('error in Population: Field disagree. (两者的译码矩阵必须一致。)')
+
+    def _debug_validate(self, pop):
+
+        """
+        描述: 检查pop能否用于替换当前种群的个体：两者染色体的编码方式和译码矩阵必须一致，
+             且各个矩阵必须要么同时为None要么同时不为None，不满足时抛出异常。
+             该函数只在__debug__为True时才会被调用，以python -O运行时这些检查会被跳过，以减少频繁调用时的开销。
+        
+        """
+
+        if self.Encoding is not None:
+            self._validate_compat(pop)
+        if self.ObjV is not None and pop.ObjV is None:
+            raise RuntimeError('error in Population: ObjV disagree. (两者的目标函数值矩阵必须要么同时为None要么同时不为None。)')
+        if self.FitnV is not None and pop.FitnV is None:
+            raise RuntimeError('error in Population: FitnV disagree. (两者的适应度列向量必须要么同时为None要么同时不为None。)')
+        if self.CV is not None and pop.CV is None:
+            raise RuntimeError('error in Population: CV disagree. (两者的违反约束程度矩阵必须要么同时为None要么同时不为None。)')
+        if self.Phen is not None and pop.Phen is None:
+            raise RuntimeError('error in Population: Phen disagree. (两者的表现型矩阵必须要么同时为None要么同时不为None。)')
 
     def __setitem__(self, index, pop):  # 种群个体赋值（种群个体替换）
 
@@ -217,40 +536,34 @@ Population : class - 种群类
         """
 
         # 对index进行格式处理
-        if not isinstance(index, (slice, np.ndarray, list, int, np.int32, np.int64)):
-            raise RuntimeError(
-                'error in Population: index must be an integer, a 1-D list, or a 1-D array. (index必须是一个整数，一维的列表或者一维的向量。)')
+        if __debug__:
+            if not isinstance(index, (slice, np.ndarray, list, int, np.int32, np.int64)):
+                raise RuntimeError(
+                    'error in Population: index must be an integer, a 1-D list, or a 1-D array. (index必须是一个整数，一维的列表或者一维的向量。)')
+            self._debug_validate(pop)
         if isinstance(index, slice):
             index_array = index
         else:
             index_array = np.array(index).reshape(-1)
             if len(index_array) == 0:
                 index_array = []
+            else:
+                index_array = _as_slice(index_array, self.sizes) or index_array  # 连续的下标向量转化为slice，以整块赋值代替逐行赋值
         if self.Encoding is not None:
-            if self.Encoding != pop.Encoding:
-                raise RuntimeError('error in Population: Encoding disagree. (两种群染色体的编码方式必须一致。)')
-            if np.all(self.Field == pop.Field) == False:
-                raise RuntimeError('error in Population: Field disagree. (两者的译码矩阵必须一致。)')
             if self.Chrom is None:
                 raise RuntimeError('error in Population: Chrom is None. (种群染色体矩阵未初始化。)')
             self.Chrom[index_array] = pop.Chrom
         if self.ObjV is not None:
-            if pop.ObjV is None:
-                raise RuntimeError('error in Population: ObjV disagree. (两者的目标函数值矩阵必须要么同时为None要么同时不为None。)')
             self.ObjV[index_array] = pop.ObjV
         if self.FitnV is not None:
-            if pop.FitnV is None:
-                raise RuntimeError('error in Population: FitnV disagree. (两者的适应度列向量必须要么同时为None要么同时不为None。)')
             self.FitnV[index_array] = pop.FitnV
         if self.CV is not None:
-            if pop.CV is None:
-                raise RuntimeError('error in Population: CV disagree. (两者的违反约束程度矩阵必须要么同时为None要么同时不为None。)')
             self.CV[index_array] = pop.CV
         if self.Phen is not None:
-            if pop.Phen is None:
-                raise RuntimeError('error in Population: Phen disagree. (两者的表现型矩阵必须要么同时为None要么同时不为None。)')
-            self.Phen[index_array] = pop.Phen
-        self.sizes = self.Phen.shape[0]  # 更新种群规模
+            if not self._phen_aliased():  # 表现型与染色体共用内存时，更新染色体即已同时更新了表现型
+                if not self.Phen.flags.writeable:
+                    self.Phen = self.Phen.copy()
+                self.Phen[index_array] = pop.Phen
 
     def __add__(self, pop):
 
@@ -266,26 +579,165 @@ Population : class - 种群类
             
         """
 
+        pool = self._pool
         if self.Encoding is None:
             NewChrom = None
         else:
-            if self.Encoding != pop.Encoding:
-                raise RuntimeError('error in Population: Encoding disagree. (两种群染色体的编码方式必须一致。)')
+            if __debug__:
+                self._validate_compat(pop)
             if self.Chrom is None or pop.Chrom is None:
                 raise RuntimeError('error in Population: Chrom is None. (种群染色体矩阵未初始化。)')
-            if np.all(self.Field == pop.Field) == False:
-                raise RuntimeError('error in Population: Field disagree. (两者的译码矩阵必须一致。)')
-            NewChrom = np.vstack([self.Chrom, pop.Chrom])
+            NewChrom = pool.concat(self.Chrom, pop.Chrom)
+        if self._phen_aliased() and pop._phen_aliased():
+            NewPhen = _readonly_view(NewChrom)
+        else:
+            NewPhen = pool.concat(self.Phen, pop.Phen) if self.Phen is not None and pop.Phen is not None else None
         NIND = self.sizes + pop.sizes  # 得到合并种群的个体数
         return Population(self.Encoding,
                           self.Field,
                           NIND,
                           NewChrom,
-                          np.vstack([self.ObjV, pop.ObjV]) if self.ObjV is not None and pop.ObjV is not None else None,
-                          np.vstack(
-                              [self.FitnV, pop.FitnV]) if self.FitnV is not None and pop.FitnV is not None else None,
-                          np.vstack([self.CV, pop.CV]) if self.CV is not None and pop.CV is not None else None,
-                          np.vstack([self.Phen, pop.Phen]) if self.Phen is not None and pop.Phen is not None else None)
+                          pool.concat(self.ObjV, pop.ObjV) if self.ObjV is not None and pop.ObjV is not None else None,
+                          pool.concat(self.FitnV, pop.FitnV) if self.FitnV is not None and pop.FitnV is not None else None,
+                          pool.concat(self.CV, pop.CV) if self.CV is not None and pop.CV is not None else None,
+                          NewPhen,
+                          self.layout,
+                          seed=self._rng,
+                          _copy=False)
+
+    def batch_split(self, n_islands, sizes=None):
+
+        """
+        描述: 把种群按个体的先后顺序划分为n_islands个子种群（如岛屿模型中的各个岛屿），返回由这些子种群组成的列表。
+
+        输入参数:
+            n_islands : int  - 子种群的数目。
+            
+            sizes     : list - (可选参数)各子种群的规模，其元素之和必须等于种群规模。
+                               缺省时尽量均分，前面的子种群比后面的子种群至多多1个个体。
+
+        注意: 各子种群的矩阵都是原种群矩阵的视图，不会进行复制，因此修改子种群的矩阵元素会同时修改原种群中对应的个体，
+             如需相互独立的子种群，应对子种群调用copy()。
+             若种群设置了seed，则各子种群会得到由其派生出的相互独立的随机数生成器。
+             
+        """
+
+        slices = _split_slices(self.sizes, n_islands, sizes, 'Population')
+        if self._rng is not None:
+            # 由种群的随机数生成器派生出相互独立的子生成器，使各子种群的随机数流互不相关
+            seeds = [np.random.default_rng(seedSeq) for seedSeq in
+                     np.random.SeedSequence(self._rng.integers(2 ** 32, size=4)).spawn(n_islands)]
+        else:
+            seeds = [None] * n_islands
+        pops = []
+        for index, seed in zip(slices, seeds):
+            pops.append(Population(self.Encoding,
+                                   self.Field,
+                                   index.stop - index.start,
+                                   self.Chrom[index] if self.Chrom is not None else None,
+                                   self.ObjV[index] if self.ObjV is not None else None,
+                                   self.FitnV[index] if self.FitnV is not None else None,
+                                   self.CV[index] if self.CV is not None else None,
+                                   self.Phen[index] if self.Phen is not None else None,
+                                   self.layout,
+                                   seed=seed,
+                                   _copy=False))
+        return pops
+
+    @staticmethod
+    def batch_merge(pops):
+
+        """
+        描述: 把列表pops中的种群按顺序合并为一个种群。
+             与逐个使用"+"进行合并相比，该函数只为每个矩阵申请一次内存，每个个体也只被复制一次。
+
+        用法: 假设pops是由多个种群组成的列表（如batch_split()的返回值），那么pop = ea.Population.batch_merge(pops)即可完成合并。
+
+        注意: 与"+"一样，某个矩阵只有在所有种群中都不为None时才会被合并，否则合并后的种群的该矩阵为None。
+             
+        """
+
+        if len(pops) == 0:
+            raise RuntimeError('error in Population: pops must not be empty. (待合并的种群列表不能为空。)')
+        first = pops[0]
+        if isinstance(first, ea.PsyPopulation):  # 多染色体种群需要逐条染色体进行合并
+            return ea.PsyPopulation.batch_merge(pops)
+        if __debug__ and first.Encoding is not None:
+            for pop in pops[1:]:
+                first._validate_compat(pop)
+        NIND = sum(pop.sizes for pop in pops)
+        pool = first._pool
+        datas = {}
+        for name in ('Chrom', 'ObjV', 'FitnV', 'CV', 'Phen'):
+            parts = [getattr(pop, name) for pop in pops]
+            if any(part is None for part in parts):
+                if name == 'Chrom' and first.Encoding is not None:
+                    raise RuntimeError('error in Population: Chrom is None. (种群染色体矩阵未初始化。)')
+                datas[name] = None
+            elif name == 'Phen' and all(pop._phen_aliased() for pop in pops):
+                datas[name] = _readonly_view(datas['Chrom'])
+            else:
+                datas[name] = pool.stack(parts)
+        return Population(first.Encoding,
+                          first.Field,
+                          NIND,
+                          datas['Chrom'] if first.Encoding is not None else None,
+                          datas['ObjV'],
+                          datas['FitnV'],
+                          datas['CV'],
+                          datas['Phen'],
+                          first.layout,
+                          seed=first._rng,
+                          _copy=False)
+
+    def resize(self, NIND):
+
+        """
+        描述: 调整种群规模，只保留种群的前NIND个个体。
+             注意：个体替换（pop[index] = pop1）不会改变种群规模，只有确实需要减少个体数目时才需调用该函数。
+
+        用法: 假设pop是一个包含10个个体的种群，那么pop.resize(5)即可只保留pop种群的前5个个体。
+             
+        """
+
+        if not isinstance(NIND, int) or NIND < 0 or NIND > self.sizes:
+            raise RuntimeError(
+                'error in Population: Size error. (种群规模设置有误，必须为不大于当前种群规模的非负整数。)')
+        for name in ('Chrom', 'ObjV', 'FitnV', 'CV', 'Phen'):
+            data = getattr(self, name)
+            if data is not None:
+                setattr(self, name, data[:NIND])
+        self.sizes = NIND
+
+    def release(self):
+
+        """
+        描述: 把种群的Chrom, ObjV, FitnV, CV, Phen归还到数组缓冲池中，供后续生成的种群重复利用。
+             调用后这些属性会被置为None，种群不再可用。
+
+        用法: 当某个种群在进化过程中被丢弃（如父子合并选择后的临时种群）时，可以调用pop.release()。
+
+        注意: 调用前必须确保没有其他地方仍在引用这些矩阵，否则它们的内容会在复用时被覆盖。
+             
+        """
+
+        pool = self._pool
+        for name in ('Chrom', 'ObjV', 'FitnV', 'CV', 'Phen'):
+            pool.put(getattr(self, name, None))
+            setattr(self, name, None)
+
+    @staticmethod
+    def clearPool():
+
+        """
+        描述: 清空所有种群共用的数组缓冲池，释放其中缓存的数组。
+             进化算法模板在进化完成后（finishing()中）会自动调用该函数。
+
+        用法: ea.Population.clearPool()
+             
+        """
+
+        Population._pool.clear()
 
     def __len__(self):
 
@@ -299,10 +751,13 @@ Population : class - 种群类
 
         return self.sizes
 
-    def save(self, dirName='Result'):
+    def save(self, dirName='Result', format='npz'):
 
         """
-        描述: 该函数将在字符串dirName所指向的文件夹下保存种群的信息，其中：
+        描述: 该函数将在字符串dirName所指向的文件夹下保存种群的信息。
+        format='npz'（默认）时，种群的所有信息以二进制形式保存在"population.npz"中，
+        可用np.load读取，其中的键与种群的属性同名，值为None的属性不会被保存。
+        format='csv'时，以文本形式分别保存到以下文件中：
         "Encoding.txt"保存种群的染色体编码；
         "Field.csv"保存种群染色体的译码矩阵；
         "Chrom.csv"保存种群的染色体矩阵；
@@ -310,25 +765,53 @@ Population : class - 种群类
         "FitnV.csv"保存种群个体的适应度列向量；
         "CV.csv"保存种群个体的违反约束程度矩阵；
         "Phen.csv"保存种群染色体表现型矩阵；
-        注意：该函数不会对种群的合法性进行检查。
+        注意：该函数不会对种群的合法性进行检查。csv文件中的数值只保留6位有效数字，需要精确保存时应使用npz格式。
         
         """
 
+        if format not in ('npz', 'csv'):
+            raise RuntimeError('error in Population.save: format must be ''npz'' or ''csv''. (format必须为''npz''或''csv''。)')
         if self.sizes > 0:
             if not os.path.exists(dirName):
                 os.makedirs(dirName)
-            with open(dirName + '/Encoding.txt', 'w') as file:
-                file.write(str(self.Encoding))
-                file.close()
-            if self.Encoding is not None:
-                np.savetxt(dirName + '/Field.csv', self.Field, delimiter=',')
-                np.savetxt(dirName + '/Chrom.csv', self.Chrom, delimiter=',')
-            if self.ObjV is not None:
-                np.savetxt(dirName + '/ObjV.csv', self.ObjV, delimiter=',')
-            if self.FitnV is not None:
-                np.savetxt(dirName + '/FitnV.csv', self.FitnV, delimiter=',')
-            if self.CV is not None:
-                np.savetxt(dirName + '/CV.csv', self.CV, delimiter=',')
-            if self.Phen is not None:
-                np.savetxt(dirName + '/Phen.csv', self.Phen, delimiter=',')
+            if format == 'npz':
+                datas = {'Encoding': np.array(str(self.Encoding))}
+                for name in ('Field', 'Chrom', 'ObjV', 'FitnV', 'CV', 'Phen'):
+                    if getattr(self, name) is not None:
+                        datas[name] = getattr(self, name)
+                np.savez(dirName + '/population.npz', **datas)
+            else:
+                with open(dirName + '/Encoding.txt', 'w') as file:
+                    file.write(str(self.Encoding))
+                if self.Encoding is not None:
+                    self._savetxt(dirName + '/Field.csv', self.Field)
+                    self._savetxt(dirName + '/Chrom.csv', self.Chrom)
+                if self.ObjV is not None:
+                    self._savetxt(dirName + '/ObjV.csv', self.ObjV)
+                if self.FitnV is not None:
+                    self._savetxt(dirName + '/FitnV.csv', self.FitnV)
+                if self.CV is not None:
+                    self._savetxt(dirName + '/CV.csv', self.CV)
+                if self.Phen is not None:
+                    self._savetxt(dirName + '/Phen.csv', self.Phen)
             print('种群信息导出完毕。')
+
+    def _savetxt(self, fileName, data):
+
+        """
+        描述: 以csv格式保存矩阵data，数值保留6位有效数字。
+             若安装了pandas，则利用其C语言实现的格式化函数进行保存，否则使用np.savetxt，并使用较大的写缓冲区以减少写文件的次数。
+             两种方式写出的文件内容完全一致：所有元素都按浮点数格式化，NaN写为nan，换行符统一为\n。
+        
+        """
+
+        try:
+            import pandas as pd
+        except ImportError:
+            pd = None
+        with open(fileName, 'w', buffering=1 << 22, newline='') as file:
+            if pd is not None:
+                pd.DataFrame(np.asarray(data, dtype=float).reshape(len(data), -1)).to_csv(
+                    file, float_format='%.6g', na_rep='nan', lineterminator='\n', header=False, index=False)
+            else:
+                np.savetxt(file, data, fmt='%.6g', delimiter=',')
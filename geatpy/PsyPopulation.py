@@ -2,6 +2,7 @@
 import os
 import numpy as np
 import geatpy as ea
+from Population import _copy_into, _split_slices
 
 
 class PsyPopulation(ea.Population):
@@ -39,7 +40,7 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
 
 """
 
-    def __init__(self, Encodings, Fields, NIND, Chroms=None, ObjV=None, FitnV=None, CV=None, Phen=None):
+    def __init__(self, Encodings, Fields, NIND, Chroms=None, ObjV=None, FitnV=None, CV=None, Phen=None, _copy=True):
 
         """
         描述: 种群类的构造函数，用于实例化种群对象，例如：
@@ -50,6 +51,7 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
              该构造函数必须传入Chroms，才算是完成种群真正的初始化。
              一开始可以只传入Encodings, Fields以及NIND来完成种群对象的实例化，
              其他属性可以后面再通过计算进行赋值。
+             _copy为内部使用的参数，为False时直接引用传入的各矩阵而不进行复制（见copy()的deep参数）。
              
         """
 
@@ -71,13 +73,13 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
             for i in range(self.ChromNum):
                 if Chroms[i] is not None:
                     self.Linds.append(Chroms[i].shape[1])
-                    self.Chroms[i] = Chroms[i].copy() if Chroms[i] is not None else None
+                    self.Chroms[i] = Chroms[i].copy() if _copy else Chroms[i]
                 else:
                     self.Linds.append(0)
-        self.ObjV = ObjV.copy() if ObjV is not None else None
-        self.FitnV = FitnV.copy() if FitnV is not None else None
-        self.CV = CV.copy() if CV is not None else None
-        self.Phen = Phen.copy() if Phen is not None else None
+        self.ObjV = ObjV.copy() if ObjV is not None and _copy else ObjV
+        self.FitnV = FitnV.copy() if FitnV is not None and _copy else FitnV
+        self.CV = CV.copy() if CV is not None and _copy else CV
+        self.Phen = Phen.copy() if Phen is not None and _copy else Phen
 
     def initChrom(self, NIND=None):
 
@@ -100,8 +102,10 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
             self.Chroms[i] = ea.crtpc(self.Encodings[i], self.sizes, self.Fields[i])  # 生成染色体矩阵
             self.Linds.append(self.Chroms[i].shape[1])  # 计算染色体的长度
         self.ObjV = None
-        self.FitnV = np.ones((self.sizes, 1))  # 默认适应度全为1
+        self.FitnV = self._pool.get((self.sizes, 1), float)
+        self.FitnV.fill(1)  # 默认适应度全为1
         self.CV = None
+        self.Phen = None  # 原有的表现型已失效，不在此处解码，而是在需要时（如计算目标函数值前）再调用decoding()进行解码
 
     def decoding(self):
 
@@ -110,29 +114,49 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
         
         """
 
-        Phen = np.ones((self.sizes, 0))  # 初始化一个空的矩阵
+        tempPhens = []
         # 遍历各染色体矩阵进行解码
         for i in range(self.ChromNum):
             if self.Encodings[i] == 'BG':  # 此时Field实际上为FieldD
-                tempPhen = ea.bs2ri(self.Chroms[i], self.Fields[i])  # 把二进制/格雷码转化为实整数
+                tempPhens.append(ea.bs2ri(self.Chroms[i], self.Fields[i]))  # 把二进制/格雷码转化为实整数
             elif self.Encodings[i] == 'RI' or self.Encodings[i] == 'P':
-                tempPhen = self.Chroms[i].copy()
+                tempPhens.append(self.Chroms[i])  # 下面会把它复制到Phen中，因此这里无需复制
             else:
                 raise RuntimeError(
                     'error in PsyPopulation.decoding: Encoding must be ''BG'' or ''RI'' or ''P''. (编码设置有误，Encoding必须为''BG'', ''RI'' 或 ''P''。)')
-            Phen = np.hstack([Phen, tempPhen])
+        # 一次性申请整个表现型矩阵，再把各染色体的表现型依次复制到对应的列中
+        Phen = np.empty((self.sizes, sum(tempPhen.shape[1] for tempPhen in tempPhens)))
+        col = 0
+        for tempPhen in tempPhens:
+            Phen[:, col:col + tempPhen.shape[1]] = tempPhen
+            col += tempPhen.shape[1]
 
         return Phen
 
-    def copy(self):
+    def copy(self, deep=True, reuse=None):
 
         """
         copy : function - 种群的复制
         用法:
             假设pop是一个种群矩阵，那么：pop1 = pop.copy()即可完成对pop种群的复制。
+            deep=False时为浅复制，pop1与pop共用同一批矩阵（各染色体矩阵以及ObjV, FitnV, CV, Phen），
+            只适合在马上会给pop1的属性重新赋值的场合使用，此时修改pop1的矩阵元素会同时修改pop对应的矩阵元素。
+            reuse为一个多染色体种群对象时，将pop的信息原地复制到reuse中并返回reuse，
+            与pop形状和类型相同的矩阵会直接用np.copyto覆盖，不再重新申请内存；注意reuse原来的矩阵不能被其他地方引用。
             
         """
 
+        if reuse is not None:
+            oldChroms = reuse.Chroms if getattr(reuse, 'ChromNum', None) == self.ChromNum else [None] * self.ChromNum
+            reuse.sizes = self.sizes
+            reuse.ChromNum = self.ChromNum
+            reuse.Encodings = self.Encodings
+            reuse.Fields = self.Fields.copy()
+            reuse.Linds = list(self.Linds)
+            reuse.Chroms = [_copy_into(oldChroms[i], self.Chroms[i]) for i in range(self.ChromNum)]
+            for name in ('ObjV', 'FitnV', 'CV', 'Phen'):
+                setattr(reuse, name, _copy_into(getattr(reuse, name, None), getattr(self, name)))
+            return reuse
         return PsyPopulation(self.Encodings,
                              self.Fields,
                              self.sizes,
@@ -140,7 +164,8 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
                              self.ObjV,
                              self.FitnV,
                              self.CV,
-                             self.Phen)
+                             self.Phen,
+                             _copy=deep)
 
     def __getitem__(self, index):
 
@@ -192,16 +217,15 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
         
         """
 
-        shuff = np.arange(self.sizes)
-        np.random.shuffle(shuff)  # 打乱顺序
+        shuff = np.random.permutation(self.sizes)  # 生成随机排列的下标
         for i in range(self.ChromNum):
             if self.Chroms[i] is None:
                 raise RuntimeError('error in PsyPopulation: Chrom[i] is None. (种群染色体矩阵未初始化。)')
-            self.Chroms[i] = self.Chroms[i][shuff, :]
-        self.ObjV = self.ObjV[shuff, :] if self.ObjV is not None else None
-        self.FitnV = self.FitnV[shuff] if self.FitnV is not None else None
-        self.CV = self.CV[shuff, :] if self.CV is not None else None
-        self.Phen = self.Phen[shuff, :] if self.Phen is not None else None
+            self.Chroms[i] = np.take(self.Chroms[i], shuff, axis=0)
+        self.ObjV = np.take(self.ObjV, shuff, axis=0) if self.ObjV is not None else None
+        self.FitnV = np.take(self.FitnV, shuff, axis=0) if self.FitnV is not None else None
+        self.CV = np.take(self.CV, shuff, axis=0) if self.CV is not None else None
+        self.Phen = np.take(self.Phen, shuff, axis=0) if self.Phen is not None else None
 
     def __setitem__(self, index, pop):  # 种群个体赋值（种群个体替换）
 
@@ -229,7 +253,7 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
         for i in range(self.ChromNum):
             if self.Encodings[i] != pop.Encodings[i]:
                 raise RuntimeError('error in PsyPopulation: Encoding disagree. (两种群染色体的编码方式必须一致。)')
-            if np.all(self.Fields[i] == pop.Fields[i]) == False:
+            if self.Fields[i] is not pop.Fields[i] and not np.array_equal(self.Fields[i], pop.Fields[i]):
                 raise RuntimeError('error in PsyPopulation: Field disagree. (两者的译码矩阵必须一致。)')
             if self.Chroms[i] is None:
                 raise RuntimeError('error in PsyPopulation: Chrom[i] is None. (种群染色体矩阵未初始化。)')
@@ -250,7 +274,6 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
             if pop.Phen is None:
                 raise RuntimeError('error in PsyPopulation: Phen disagree. (两者的表现型矩阵必须要么同时为None要么同时不为None。)')
             self.Phen[index_array] = pop.Phen
-        self.sizes = self.Phen.shape[0]  # 更新种群规模
 
     def __add__(self, pop):
 
@@ -265,26 +288,137 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
         """
 
         NIND = self.sizes + pop.sizes  # 得到合并种群的个体数
-        NewChroms = self.Chroms
+        pool = self._pool
+        NewChroms = [None] * self.ChromNum
         for i in range(self.ChromNum):
             if self.Encodings[i] != pop.Encodings[i]:
                 raise RuntimeError('error in PsyPopulation: Encoding disagree. (两种群染色体的编码方式必须一致。)')
-            if np.all(self.Fields[i] == pop.Fields[i]) == False:
+            if self.Fields[i] is not pop.Fields[i] and not np.array_equal(self.Fields[i], pop.Fields[i]):
                 raise RuntimeError('error in PsyPopulation: Field disagree. (两者的译码矩阵必须一致。)')
             if self.Chroms[i] is None or pop.Chroms[i] is None:
                 raise RuntimeError('error in PsyPopulation: Chrom is None. (种群染色体矩阵未初始化。)')
-            NewChroms[i] = np.vstack([NewChroms[i], pop.Chroms[i]])
+            NewChroms[i] = pool.concat(self.Chroms[i], pop.Chroms[i])
         return PsyPopulation(self.Encodings,
                              self.Fields,
                              NIND,
                              NewChroms,
-                             np.vstack(
-                                 [self.ObjV, pop.ObjV]) if self.ObjV is not None and pop.ObjV is not None else None,
-                             np.vstack(
-                                 [self.FitnV, pop.FitnV]) if self.FitnV is not None and pop.FitnV is not None else None,
-                             np.vstack([self.CV, pop.CV]) if self.CV is not None and pop.CV is not None else None,
-                             np.vstack(
-                                 [self.Phen, pop.Phen]) if self.Phen is not None and pop.Phen is not None else None)
+                             pool.concat(self.ObjV, pop.ObjV) if self.ObjV is not None and pop.ObjV is not None else None,
+                             pool.concat(self.FitnV, pop.FitnV) if self.FitnV is not None and pop.FitnV is not None else None,
+                             pool.concat(self.CV, pop.CV) if self.CV is not None and pop.CV is not None else None,
+                             pool.concat(self.Phen, pop.Phen) if self.Phen is not None and pop.Phen is not None else None,
+                             _copy=False)  # 合并结果都是新申请的矩阵，无需再复制
+
+    def batch_split(self, n_islands, sizes=None):
+
+        """
+        描述: 把种群按个体的先后顺序划分为n_islands个子种群（如岛屿模型中的各个岛屿），返回由这些子种群组成的列表。
+
+        输入参数:
+            n_islands : int  - 子种群的数目。
+            
+            sizes     : list - (可选参数)各子种群的规模，其元素之和必须等于种群规模。
+                               缺省时尽量均分，前面的子种群比后面的子种群至多多1个个体。
+
+        注意: 各子种群的各染色体矩阵等都是原种群矩阵的视图，不会进行复制，因此修改子种群的矩阵元素会同时修改原种群中对应的个体，
+             如需相互独立的子种群，应对子种群调用copy()。
+             
+        """
+
+        pops = []
+        for index in _split_slices(self.sizes, n_islands, sizes, 'PsyPopulation'):
+            pops.append(PsyPopulation(self.Encodings,
+                                      self.Fields,
+                                      index.stop - index.start,
+                                      [Chrom[index] if Chrom is not None else None for Chrom in self.Chroms],
+                                      self.ObjV[index] if self.ObjV is not None else None,
+                                      self.FitnV[index] if self.FitnV is not None else None,
+                                      self.CV[index] if self.CV is not None else None,
+                                      self.Phen[index] if self.Phen is not None else None,
+                                      _copy=False))
+        return pops
+
+    @staticmethod
+    def batch_merge(pops):
+
+        """
+        描述: 把列表pops中的多染色体种群按顺序合并为一个种群。
+             与逐个使用"+"进行合并相比，该函数只为每个矩阵申请一次内存，每个个体也只被复制一次。
+
+        用法: 假设pops是由多个多染色体种群组成的列表（如batch_split()的返回值），那么pop = ea.PsyPopulation.batch_merge(pops)即可完成合并。
+
+        注意: 与"+"一样，ObjV, FitnV, CV, Phen只有在所有种群中都不为None时才会被合并，否则合并后的种群的该矩阵为None。
+             
+        """
+
+        if len(pops) == 0:
+            raise RuntimeError('error in PsyPopulation: pops must not be empty. (待合并的种群列表不能为空。)')
+        first = pops[0]
+        for pop in pops[1:]:
+            for i in range(first.ChromNum):
+                if first.Encodings[i] != pop.Encodings[i]:
+                    raise RuntimeError('error in PsyPopulation: Encoding disagree. (两种群染色体的编码方式必须一致。)')
+                if first.Fields[i] is not pop.Fields[i] and not np.array_equal(first.Fields[i], pop.Fields[i]):
+                    raise RuntimeError('error in PsyPopulation: Field disagree. (两者的译码矩阵必须一致。)')
+        NIND = sum(pop.sizes for pop in pops)
+        pool = first._pool
+        NewChroms = []
+        for i in range(first.ChromNum):
+            parts = [pop.Chroms[i] for pop in pops]
+            if any(part is None for part in parts):
+                raise RuntimeError('error in PsyPopulation: Chrom is None. (种群染色体矩阵未初始化。)')
+            NewChroms.append(pool.stack(parts))
+        datas = {}
+        for name in ('ObjV', 'FitnV', 'CV', 'Phen'):
+            parts = [getattr(pop, name) for pop in pops]
+            datas[name] = None if any(part is None for part in parts) else pool.stack(parts)
+        return PsyPopulation(first.Encodings,
+                             first.Fields,
+                             NIND,
+                             NewChroms,
+                             datas['ObjV'],
+                             datas['FitnV'],
+                             datas['CV'],
+                             datas['Phen'],
+                             _copy=False)
+
+    def resize(self, NIND):
+
+        """
+        描述: 调整种群规模，只保留种群的前NIND个个体。
+             注意：个体替换（pop[index] = pop1）不会改变种群规模，只有确实需要减少个体数目时才需调用该函数。
+
+        用法: 假设pop是一个包含10个个体的种群，那么pop.resize(5)即可只保留pop种群的前5个个体。
+             
+        """
+
+        if not isinstance(NIND, int) or NIND < 0 or NIND > self.sizes:
+            raise RuntimeError(
+                'error in PsyPopulation: Size error. (种群规模设置有误，必须为不大于当前种群规模的非负整数。)')
+        for i in range(self.ChromNum):
+            if self.Chroms[i] is not None:
+                self.Chroms[i] = self.Chroms[i][:NIND]
+        for name in ('ObjV', 'FitnV', 'CV', 'Phen'):
+            data = getattr(self, name)
+            if data is not None:
+                setattr(self, name, data[:NIND])
+        self.sizes = NIND
+
+    def release(self):
+
+        """
+        描述: 把种群的各染色体矩阵以及ObjV, FitnV, CV, Phen归还到数组缓冲池中，供后续生成的种群重复利用。
+             调用后这些属性会被置为None，种群不再可用。
+        注意: 调用前必须确保没有其他地方仍在引用这些矩阵，否则它们的内容会在复用时被覆盖。
+        
+        """
+
+        pool = self._pool
+        for i in range(self.ChromNum):
+            pool.put(self.Chroms[i])
+            self.Chroms[i] = None
+        for name in ('ObjV', 'FitnV', 'CV', 'Phen'):
+            pool.put(getattr(self, name))
+            setattr(self, name, None)
 
     def __len__(self):
 
@@ -297,10 +431,14 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
 
         return self.sizes
 
-    def save(self, dirName='Result'):
+    def save(self, dirName='Result', format='npz'):
 
         """
-        描述: 该函数将在字符串dirName所指向的文件夹下保存种群的信息，其中：
+        描述: 该函数将在字符串dirName所指向的文件夹下保存种群的信息。
+        format='npz'（默认）时，种群的所有信息以二进制形式保存在"population.npz"中，可用np.load读取，
+        其中"Encodings"为各染色体的编码方式，"Fieldsi"和"Chromsi"为第i条染色体的译码矩阵和染色体矩阵，i为0,1,2,3...，
+        其余的键与种群的属性同名，值为None的属性不会被保存。
+        format='csv'时，以文本形式分别保存到以下文件中：
         "Encodingsi.txt"保存种群的染色体编码，i为0,1,2,3...；
         "Fieldsi.csv"保存种群染色体的译码矩阵，i为0,1,2,3...；
         "Chromsi.csv"保存种群的染色体矩阵，i为0,1,2,3...；
@@ -308,25 +446,36 @@ PsyPopulation : class - 多染色体种群类(Popysomy Population)
         "FitnV.csv"保存种群个体的适应度列向量；
         "CV.csv"保存种群个体的违反约束程度矩阵；
         "Phen.csv"保存种群染色体表现型矩阵；
-        注意：该函数不会对种群的合法性进行检查。
+        注意：该函数不会对种群的合法性进行检查。csv文件中的数值只保留6位有效数字，需要精确保存时应使用npz格式。
         
         """
 
+        if format not in ('npz', 'csv'):
+            raise RuntimeError('error in PsyPopulation.save: format must be ''npz'' or ''csv''. (format必须为''npz''或''csv''。)')
         if self.sizes > 0:
             if os.path.exists(dirName) == False:
                 os.makedirs(dirName)
-            for i in range(self.ChromNum):
-                with open(dirName + '/Encodings' + str(i) + '.txt', 'w') as file:
-                    file.write(str(self.Encodings[i]))
-                    file.close()
-                np.savetxt(dirName + '/Fields' + str(i) + '.csv', self.Fields[i], delimiter=',')
-                np.savetxt(dirName + '/Chroms' + str(i) + '.csv', self.Chroms[i], delimiter=',')
-            if self.ObjV is not None:
-                np.savetxt(dirName + '/ObjV.csv', self.ObjV, delimiter=',')
-            if self.FitnV is not None:
-                np.savetxt(dirName + '/FitnV.csv', self.FitnV, delimiter=',')
-            if self.CV is not None:
-                np.savetxt(dirName + '/CV.csv', self.CV, delimiter=',')
-            if self.Phen is not None:
-                np.savetxt(dirName + '/Phen.csv', self.Phen, delimiter=',')
+            if format == 'npz':
+                datas = {'Encodings': np.array([str(Encoding) for Encoding in self.Encodings])}
+                for i in range(self.ChromNum):
+                    datas['Fields' + str(i)] = self.Fields[i]
+                    datas['Chroms' + str(i)] = self.Chroms[i]
+                for name in ('ObjV', 'FitnV', 'CV', 'Phen'):
+                    if getattr(self, name) is not None:
+                        datas[name] = getattr(self, name)
+                np.savez(dirName + '/population.npz', **datas)
+            else:
+                for i in range(self.ChromNum):
+                    with open(dirName + '/Encodings' + str(i) + '.txt', 'w') as file:
+                        file.write(str(self.Encodings[i]))
+                    self._savetxt(dirName + '/Fields' + str(i) + '.csv', self.Fields[i])
+                    self._savetxt(dirName + '/Chroms' + str(i) + '.csv', self.Chroms[i])
+                if self.ObjV is not None:
+                    self._savetxt(dirName + '/ObjV.csv', self.ObjV)
+                if self.FitnV is not None:
+                    self._savetxt(dirName + '/FitnV.csv', self.FitnV)
+                if self.CV is not None:
+                    self._savetxt(dirName + '/CV.csv', self.CV)
+                if self.Phen is not None:
+                    self._savetxt(dirName + '/Phen.csv', self.Phen)
             print('种群信息导出完毕。')
@@ -36,7 +36,7 @@ class MyProblem(ea.Problem):  # 继承Problem父类
         ea.Problem.__init__(self, name, M, maxormins, Dim, varTypes, lb, ub, lbin, ubin)
 
     def aimFunc(self, pop):  # 目标函数
-        centers = pop.Phen.reshape(int(pop.sizes * self.k), int(pop.Phen.shape[1] / self.k))  # 得到聚类中心
+        centers = pop.Phen.reshape(int(pop.sizes * self.k), int(pop.Phen.shape[1] / self.k)).copy()  # 得到聚类中心（后面要修改聚类中心，故需要复制）
         dis = cdist(centers, self.datas, 'euclidean')  # 计算距离
         dis_split = dis.reshape(pop.sizes, self.k, self.datas.shape[0])  # 分割距离矩阵，把各个聚类中心到各个点之间的距离的数据分开
         labels = np.argmin(dis_split, 1)[0]  # 得到聚类标签值
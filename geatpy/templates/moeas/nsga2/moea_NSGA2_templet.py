@@ -62,7 +62,9 @@ moea_NSGA2_templet : class - 多目标进化NSGA-II算法模板
         dis = ea.crowdis(population.ObjV, levels)  # 计算拥挤距离
         population.FitnV[:, 0] = np.argsort(np.lexsort(np.array([dis, -levels])), kind='mergesort')  # 计算适应度
         chooseFlag = ea.selecting('dup', population.FitnV, NUM)  # 调用低级选择算子dup进行基于适应度排序的选择，保留NUM个个体
-        return population[chooseFlag]
+        newPop = population[chooseFlag]
+        population.release()  # 父子合并得到的临时种群已不再需要，把其占用的内存归还到缓冲池中
+        return newPop
 
     def run(self, prophetPop=None):  # prophetPop为先知种群（即包含先验知识的种群）
         # ==========================初始化配置===========================